@@ -18,24 +18,25 @@ from pycalphad.core.utils import instantiate_models, filter_phases, extract_para
 from pycalphad.core.phase_rec import PhaseRecord
 
 from espei.utils import PickleableTinyDB
-from espei.shadow_functions import equilibrium_, calculate_, no_op_equilibrium_, update_phase_record_parameters
+from espei.shadow_functions import equilibrium_, calculate_, no_op_equilibrium_, update_phase_record_parameters, build_conditions_cache, ConditionsCache
 
 _log = logging.getLogger(__name__)
 
 
-EqPropData = NamedTuple('EqPropData', (('dbf', Database),
-                                       ('species', Sequence[v.Species]),
-                                       ('phases', Sequence[str]),
-                                       ('potential_conds', Dict[v.StateVariable, float]),
-                                       ('composition_conds', Sequence[Dict[v.X, float]]),
-                                       ('models', Dict[str, Model]),
-                                       ('params_keys', Dict[str, float]),
-                                       ('phase_records', Sequence[Dict[str, PhaseRecord]]),
-                                       ('output', str),
-                                       ('samples', np.ndarray),
-                                       ('weight', np.ndarray),
-                                       ('reference', str),
-                                       ))
+class EqPropData(NamedTuple):
+    dbf: Database
+    species: Sequence[v.Species]
+    phases: Sequence[str]
+    potential_conds: Dict[v.StateVariable, float]
+    composition_conds: Sequence[Dict[v.X, float]]
+    models: Dict[str, Model]
+    params_keys: Dict[str, float]
+    phase_records: Sequence[Dict[str, PhaseRecord]]
+    output: str
+    samples: np.ndarray
+    weight: np.ndarray
+    reference: str
+    conditions_caches: Optional[Sequence[ConditionsCache]] = None  # 1:1 with composition_conds, built on the fly if None
 
 
 def build_eqpropdata(data: tinydb.database.Document,
@@ -111,7 +112,10 @@ def build_eqpropdata(data: tinydb.database.Document,
     dataset_weights = np.array(data.get('weight', 1.0)) * np.ones(total_num_calculations)
     weights = (property_std_deviation.get(property_output, 1.0)/data_weight_dict.get(property_output, 1.0)/dataset_weights).flatten()
 
-    return EqPropData(dbf, species, data_phases, pot_conds, rav_comp_conds, models, params_keys, phase_records, output, samples, weights, reference)
+    # 1:1 with rav_comp_conds, prepared once so equilibrium doesn't redo it for each parameter evaluation
+    conditions_caches = [build_conditions_cache(OrderedDict(**pot_conds, **comp_conds)) for comp_conds in rav_comp_conds]
+
+    return EqPropData(dbf, species, data_phases, pot_conds, rav_comp_conds, models, params_keys, phase_records, output, samples, weights, reference, conditions_caches)
 
 
 def get_equilibrium_thermochemical_data(dbf: Database, comps: Sequence[str],
@@ -211,12 +215,17 @@ def calc_prop_differences(eqpropdata: EqPropData,
     samples = np.array(eqpropdata.samples, dtype=np.float_)
 
     calculated_data = []
-    for comp_conds in eqpropdata.composition_conds:
+    conditions_caches = eqpropdata.conditions_caches
+    if conditions_caches:
+        assert len(conditions_caches) == len(eqpropdata.composition_conds), f"Number of prepared conditions ({len(conditions_caches)}) does not match number of composition conditions ({len(eqpropdata.composition_conds)})"
+    for idx, comp_conds in enumerate(eqpropdata.composition_conds):
         cond_dict = OrderedDict(**pot_conds, **comp_conds)
+        # equilibrium prepares the plain conditions itself if they weren't prepared up front
+        eq_conds = conditions_caches[idx] if conditions_caches else cond_dict
         # str_statevar_dict must be sorted, assumes that pot_conds are.
         str_statevar_dict = OrderedDict([(str(key), vals) for key, vals in pot_conds.items()])
         grid = calculate_(species, phases, str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
-        multi_eqdata = _equilibrium(phase_records, cond_dict, grid)
+        multi_eqdata = _equilibrium(phase_records, eq_conds, grid)
         # TODO: could be kind of slow. Callables (which are cachable) must be built.
         propdata = _eqcalculate(dbf, species, phases, cond_dict, output, data=multi_eqdata, per_phase=False, callables=None, parameters=params_dict, model=models)
 
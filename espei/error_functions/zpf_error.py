@@ -15,7 +15,7 @@ composition conditions to calculate chemical potentials at.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import OrderedDict
 from typing import Sequence, Dict, Any, Union, List, Tuple, Type, Optional
 
@@ -29,7 +29,7 @@ from pycalphad.codegen.callables import build_phase_records
 from pycalphad.core.utils import instantiate_models, filter_phases, unpack_components
 from pycalphad.core.phase_rec import PhaseRecord
 from espei.utils import PickleableTinyDB
-from espei.shadow_functions import equilibrium_, calculate_, no_op_equilibrium_, update_phase_record_parameters, constrained_equilibrium
+from espei.shadow_functions import equilibrium_, calculate_, no_op_equilibrium_, update_phase_record_parameters, constrained_equilibrium, build_conditions_cache, ConditionsCache
 from pycalphad.core.calculate import _sample_phase_constitution
 from pycalphad.core.utils import point_sample
 
@@ -45,14 +45,21 @@ class RegionVertex:
     phase_records: Dict[str, PhaseRecord]
     is_disordered: bool
     has_missing_comp_cond: bool
+    conditions_cache: Optional[ConditionsCache] = None  # prepared potential and composition conditions, see ``_vertex_conditions``
 
-@dataclass
+@dataclass(frozen=True)
 class PhaseRegion:
     vertices: Sequence[RegionVertex]
     potential_conds: Dict[v.StateVariable, float]
     species: Sequence[v.Species]
     phases: Sequence[str]
     models: Dict[str, Model]
+    str_statevar_dict: Dict[str, float] = field(init=False, repr=False)  # potential conditions, sorted by name
+
+    def __post_init__(self):
+        # frozen, so derived fields must be set through object.__setattr__
+        str_statevar_dict = OrderedDict([(str(key), self.potential_conds[key]) for key in sorted(self.potential_conds.keys(), key=str)])
+        object.__setattr__(self, 'str_statevar_dict', str_statevar_dict)
 
     def eq_str(self):
         phase_compositions = ', '.join(f'{vtx.phase_name}: {vtx.comp_conds}' for vtx in self.vertices)
@@ -195,7 +202,12 @@ def get_zpf_data(dbf: Database, comps: Sequence[str], phases: Sequence[str], dat
                     tol = 0.05
                     phase_points = _subsample_phase_points(phase_recs[phase_name], all_phase_points[phase_name], composition, tol)
                     assert phase_points.shape[0] > 0, "at least one set of points is within the target tolerance"
-                vtx = RegionVertex(phase_name, composition, comp_conds, phase_points, phase_recs, disordered_flag, has_missing_comp_cond)
+                if has_missing_comp_cond:
+                    # Unknown compositions are never used in equilibrium calculations
+                    conds_cache = None
+                else:
+                    conds_cache = build_conditions_cache({**pot_conds, **comp_conds})
+                vtx = RegionVertex(phase_name, composition, comp_conds, phase_points, phase_recs, disordered_flag, has_missing_comp_cond, conds_cache)
                 vertices.append(vtx)
             region = PhaseRegion(vertices, pot_conds, species, data_phases, models)
             phase_regions.append(region)
@@ -209,6 +221,13 @@ def get_zpf_data(dbf: Database, comps: Sequence[str], phases: Sequence[str], dat
     return zpf_data
 
 
+def _vertex_conditions(phase_region: PhaseRegion, vertex: RegionVertex) -> ConditionsCache:
+    """Return the prepared conditions for a vertex, building them if the vertex was constructed without them."""
+    if vertex.conditions_cache is not None:
+        return vertex.conditions_cache
+    return build_conditions_cache({**phase_region.potential_conds, **vertex.comp_conds})
+
+
 def estimate_hyperplane(phase_region: PhaseRegion, parameters: np.ndarray, approximate_equilibrium: bool = False) -> np.ndarray:
     """
     Calculate the chemical potentials for the target hyperplane, one vertex at a time
@@ -234,16 +253,14 @@ def estimate_hyperplane(phase_region: PhaseRegion, parameters: np.ndarray, appro
     for vertex in phase_region.vertices:
         phase_records = vertex.phase_records
         update_phase_record_parameters(phase_records, parameters)
-        cond_dict = {**vertex.comp_conds, **phase_region.potential_conds}
         if vertex.has_missing_comp_cond:
             # This composition is unknown -- it doesn't contribute to hyperplane estimation
             pass
         else:
             # Extract chemical potential hyperplane from multi-phase calculation
             # Note that we consider all phases in the system, not just ones in this tie region
-            str_statevar_dict = OrderedDict([(str(key), cond_dict[key]) for key in sorted(phase_region.potential_conds.keys(), key=str)])
-            grid = calculate_(species, phases, str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
-            multi_eqdata = _equilibrium(phase_records, cond_dict, grid)
+            grid = calculate_(species, phases, phase_region.str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
+            multi_eqdata = _equilibrium(phase_records, _vertex_conditions(phase_region, vertex), grid)
             target_hyperplane_phases.append(multi_eqdata.Phase.squeeze())
             # Does there exist only a single phase in the result with zero internal degrees of freedom?
             # We should exclude those chemical potentials from the average because they are meaningless.
@@ -268,7 +285,7 @@ def driving_force_to_hyperplane(target_hyperplane_chempots: np.ndarray,
     models = phase_region.models
     current_phase = vertex.phase_name
     cond_dict = {**phase_region.potential_conds, **vertex.comp_conds}
-    str_statevar_dict = OrderedDict([(str(key),cond_dict[key]) for key in sorted(phase_region.potential_conds.keys(), key=str)])
+    str_statevar_dict = phase_region.str_statevar_dict
     phase_points = vertex.points
     phase_records = vertex.phase_records
     update_phase_record_parameters(phase_records, parameters)
@@ -309,7 +326,7 @@ def driving_force_to_hyperplane(target_hyperplane_chempots: np.ndarray,
         # Extract energies from single-phase calculations
         grid = calculate_(species, [current_phase], str_statevar_dict, models, phase_records, points=phase_points, pdens=50, fake_points=True)
         # TODO: consider enabling approximate for this?
-        converged, energy = constrained_equilibrium(phase_records, cond_dict, grid)
+        converged, energy = constrained_equilibrium(phase_records, _vertex_conditions(phase_region, vertex), grid)
         if not converged:
             _log.debug('Calculation failure: constrained equilibrium not converged for %s, conditions: %s, parameters %s', current_phase, cond_dict, parameters)
             return np.inf
@@ -4,7 +4,8 @@ pycalphad functions for very fast performance.
 """
 
 from collections import OrderedDict
-from typing import Sequence, Dict, Optional
+from dataclasses import dataclass
+from typing import Sequence, Dict, Optional, Tuple, Union
 from numpy.typing import ArrayLike
 import numpy as np
 from pycalphad import Model, variables as v
@@ -21,13 +22,53 @@ from pycalphad.core.solver import Solver
 
 def update_phase_record_parameters(phase_records: Dict[str, PhaseRecord], parameters: ArrayLike) -> None:
     if parameters.size > 0:
+        # very important that these are floats, otherwise parameters can end up
+        # with garbage data. `np.asarray` does not create a copy if the type is
+        # correct, so cast once here instead of once per phase record
+        parameters = np.asarray(parameters, dtype=np.float_)
         for phase_name, phase_record in phase_records.items():
-            # very important that these are floats, otherwise parameters can end up
-            # with garbage data. `np.asarray` does not create a copy if the type is
-            # correct
-            phase_record.parameters[:] = np.asarray(parameters, dtype=np.float_)
+            phase_record.parameters[:] = parameters
 
-def _single_phase_start_point(conditions, state_variables, phase_records, grid):
+
+@dataclass(frozen=True)
+class ConditionsCache:
+    """Conditions preprocessed once for repeated fast equilibrium calculations.
+
+    The conditions for a dataset do not change between parameter evaluations,
+    so the pycalphad condition handling can be done once up front rather than
+    on every call to ``equilibrium_``, ``constrained_equilibrium`` or
+    ``no_op_equilibrium_``. The same instance is shared by every evaluation,
+    so the condition values are read-only arrays.
+    """
+    conditions: Dict[v.StateVariable, np.ndarray]  # adjusted by ``_adjust_conditions``
+    str_conds: Dict[str, np.ndarray]  # sorted by name
+    statevars: Tuple[v.StateVariable, ...]  # sorted by name
+    point_state_vars: np.ndarray  # first value of each state variable in ``statevars``, for point calculations
+
+
+def _read_only_array(values: ArrayLike) -> np.ndarray:
+    arr = np.array(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+def build_conditions_cache(conditions: Dict[v.StateVariable, ArrayLike]) -> ConditionsCache:
+    """Return a ConditionsCache for conditions that will be used repeatedly."""
+    statevars = tuple(sorted(get_state_variables(conds=conditions), key=str))
+    conditions = OrderedDict([(ky, _read_only_array(vals)) for ky, vals in _adjust_conditions(conditions).items()])
+    str_conds = OrderedDict([(str(ky), conditions[ky]) for ky in sorted(conditions.keys(), key=str)])
+    point_state_vars = np.fromiter((conditions[sv][0] for sv in statevars), dtype=np.float64, count=len(statevars))
+    point_state_vars.setflags(write=False)
+    return ConditionsCache(conditions, str_conds, statevars, point_state_vars)
+
+
+def _as_conditions_cache(conditions: Union[Dict[v.StateVariable, ArrayLike], ConditionsCache]) -> ConditionsCache:
+    if isinstance(conditions, ConditionsCache):
+        return conditions
+    return build_conditions_cache(conditions)
+
+
+def _single_phase_start_point(state_vars, phase_records, grid):
     """Return a single CompositionSet object to use in a point calculation
 
     Assumes the grid has includes only candidate phases. The starting point will be
@@ -36,10 +77,8 @@ def _single_phase_start_point(conditions, state_variables, phase_records, grid):
 
     Parameters
     ----------
-    conditions : Dict[v.StateVariable, ArrayLike]
-        Conditions in this region. Assumes state variable conditions have size == 1.
-    state_variables : List[v.StateVariable]
-        Active state variables in the calculation
+    state_vars : np.ndarray
+        Values of the active state variables in the calculation, sorted by name.
     phase_records : Dict[str, PhaseRecord]
         Phase records, can have more than just the phase of interest
     grid : LightDataset
@@ -49,15 +88,14 @@ def _single_phase_start_point(conditions, state_variables, phase_records, grid):
     # assumes state variables in the conditions have size == 1
     idx_min = grid.GM.argmin()
     # Assumes ordering of dimensions is [state variables, points, data_variable...]
-    # Get phase record
-    phase_name = str(grid.Phase[..., idx_min].squeeze())
+    # Get phase record. Indexing the flattened arrays avoids building and
+    # squeezing intermediate arrays; valid because state variables have size 1
+    phase_name = str(grid.Phase.flat[idx_min])
     prx = phase_records[phase_name]
-    Y = grid.Y[..., idx_min, :].squeeze()[:prx.phase_dof]
-    # Get current state variables
-    # TODO: can we assume sorting
-    state_vars = np.array([conditions[sv][0] for sv in sorted(state_variables, key=str)])
+    Y = grid.Y.reshape(-1, grid.Y.shape[-1])[idx_min, :prx.phase_dof]
     compset = CompositionSet(prx)
-    compset.update(Y, 1.0, state_vars)
+    # CompositionSet.update requires a writable buffer, state_vars may be read-only
+    compset.update(Y, 1.0, np.array(state_vars))
     return compset
 
 
@@ -77,7 +115,8 @@ def calculate_(species: Sequence[v.Species], phases: Sequence[str],
     nonvacant_components = [x for x in sorted(species) if x.number_of_atoms > 0]
     maximum_internal_dof = max(prx.phase_dof for prx in phase_records.values())
     all_phase_data = []
-    for phase_name in sorted(phases):
+    sorted_phases = sorted(phases)
+    for phase_name in sorted_phases:
         mod = models[phase_name]
         phase_record = phase_records[phase_name]
         points = points_dict[phase_name]
@@ -85,7 +124,7 @@ def calculate_(species: Sequence[v.Species], phases: Sequence[str],
             points = _sample_phase_constitution(mod, point_sample, True, pdens_dict[phase_name])
         points = np.atleast_2d(points)
 
-        fp = fake_points and (phase_name == sorted(phases)[0])
+        fp = fake_points and (phase_name == sorted_phases[0])
         phase_ds = _compute_phase_values(nonvacant_components, str_statevar_dict,
                                          points, phase_record, output,
                                          maximum_internal_dof, broadcast=broadcast,
@@ -113,33 +152,30 @@ def calculate_(species: Sequence[v.Species], phases: Sequence[str],
 
 
 def constrained_equilibrium(phase_records: Dict[str, PhaseRecord],
-                 conditions: Dict[v.StateVariable, np.ndarray], grid: LightDataset):
+                 conditions: Union[Dict[v.StateVariable, np.ndarray], ConditionsCache], grid: LightDataset):
     """Perform an equilibrium calculation with just a single composition set that is constrained to the global composition condition"""
-    statevars = get_state_variables(conds=conditions)
-    conditions = _adjust_conditions(conditions)
+    conds_cache = _as_conditions_cache(conditions)
     # Assume that all conditions keys are lists with exactly one element (point calculation)
-    str_conds = OrderedDict([(str(ky), conditions[ky][0]) for ky in sorted(conditions.keys(), key=str)])
-    compset = _single_phase_start_point(conditions, statevars, phase_records, grid)
+    str_conds = OrderedDict([(ky, vals[0]) for ky, vals in conds_cache.str_conds.items()])
+    compset = _single_phase_start_point(conds_cache.point_state_vars, phase_records, grid)
     # modifies `compset` in place
     solver_result = solve_and_update([compset], str_conds, Solver())
     energy = compset.NP * compset.energy
     return solver_result.converged, energy
 
 def equilibrium_(phase_records: Dict[str, PhaseRecord],
-                 conditions: Dict[v.StateVariable, np.ndarray], grid: LightDataset
+                 conditions: Union[Dict[v.StateVariable, np.ndarray], ConditionsCache], grid: LightDataset
                  ) -> LightDataset:
     """
     Perform a fast equilibrium calculation with virtually no overhead.
     """
-    statevars = sorted(get_state_variables(conds=conditions), key=str)
-    conditions = _adjust_conditions(conditions)
-    str_conds = OrderedDict([(str(ky), conditions[ky]) for ky in sorted(conditions.keys(), key=str)])
-    start_point = starting_point(conditions, statevars, phase_records, grid)
-    return _solve_eq_at_conditions(start_point, phase_records, grid, str_conds, statevars, False)
+    conds_cache = _as_conditions_cache(conditions)
+    start_point = starting_point(conds_cache.conditions, conds_cache.statevars, phase_records, grid)
+    return _solve_eq_at_conditions(start_point, phase_records, grid, conds_cache.str_conds, conds_cache.statevars, False)
 
 
 def no_op_equilibrium_(phase_records: Dict[str, PhaseRecord],
-                       conditions: Dict[v.StateVariable, np.ndarray],
+                       conditions: Union[Dict[v.StateVariable, np.ndarray], ConditionsCache],
                        grid: LightDataset,
                        ) -> LightDataset:
     """
@@ -153,6 +189,5 @@ def no_op_equilibrium_(phase_records: Dict[str, PhaseRecord],
     ``_equilibrium``, but ``species`` are not needed.
 
     """
-    statevars = get_state_variables(conds=conditions)
-    conditions = _adjust_conditions(conditions)
-    return starting_point(conditions, statevars, phase_records, grid)
+    conds_cache = _as_conditions_cache(conditions)
+    return starting_point(conds_cache.conditions, conds_cache.statevars, phase_records, grid)
@@ -3,6 +3,7 @@
 Test different error functions as isolated units.
 """
 
+from dataclasses import replace
 from unittest import mock
 import numpy as np
 import pytest
@@ -14,6 +15,7 @@ from pycalphad import Database, Model, variables as v
 from espei.paramselect import generate_parameters
 from espei.error_functions import *
 from espei.error_functions.equilibrium_thermochemical_error import calc_prop_differences
+from espei.error_functions.zpf_error import RegionVertex
 
 from .fixtures import datasets_db
 from .testing_data import *
@@ -241,6 +243,11 @@ def test_subsystem_zpf_probability(datasets_db):
     # Truth
     zpf_data = get_zpf_data(dbf_bin, ['CR', 'NI', 'VA'], phases, datasets_db, {})
     bin_prob = calculate_zpf_error(zpf_data, np.array([]))
+    # The BCC_A2 compositions are null, so only the FCC_A1 vertices get prepared conditions
+    for phase_region in zpf_data[0]['phase_regions']:
+        for vertex in phase_region.vertices:
+            assert vertex.has_missing_comp_cond == (vertex.phase_name == 'BCC_A2')
+            assert (vertex.conditions_cache is None) == vertex.has_missing_comp_cond
 
     # Getting binary subsystem data explictly (from binary input)
     zpf_data = get_zpf_data(dbf_tern, ['CR', 'NI', 'VA'], phases, datasets_db, {})
@@ -315,6 +322,29 @@ def test_zpf_error_works_for_stoichiometric_cmpd_tielines(datasets_db):
     assert np.isclose(approx_likelihood, zero_error_probability, rtol=1e-6)
 
 
+def test_zpf_error_vertices_without_conditions_cache(datasets_db):
+    """RegionVertex objects constructed without prepared conditions give the same ZPF error."""
+    datasets_db.insert(CU_MG_DATASET_ZPF_ZERO_ERROR)
+
+    dbf = Database(CU_MG_TDB)
+    comps = ['CU','MG','VA']
+    phases = list(dbf.phases.keys())
+
+    zpf_data = get_zpf_data(dbf, comps, phases, datasets_db, {})
+    expected_prob = calculate_zpf_error(zpf_data, np.array([]))
+    for data in zpf_data:
+        data['phase_regions'] = [
+            replace(region, vertices=[
+                RegionVertex(vtx.phase_name, vtx.composition, vtx.comp_conds, vtx.points, vtx.phase_records, vtx.is_disordered, vtx.has_missing_comp_cond)
+                for vtx in region.vertices
+            ])
+            for region in data['phase_regions']
+        ]
+    assert all(vtx.conditions_cache is None for region in zpf_data[0]['phase_regions'] for vtx in region.vertices)
+    prob = calculate_zpf_error(zpf_data, np.array([]))
+    assert np.isclose(prob, expected_prob)
+
+
 def test_non_equilibrium_thermochemcial_species(datasets_db):
     """Test species work for non-equilibrium thermochemical data."""
 
@@ -384,6 +414,9 @@ def test_equilibrium_thermochemical_error_computes_correct_probability(datasets_
     # change to -40000
     errors, weights = calc_prop_differences(eqdata[0], np.array([-40000], np.float_))
     assert np.all(np.isclose(errors, [-40000*0.5*0.5]))
+    # EqPropData without prepared conditions gives the same result
+    errors, weights = calc_prop_differences(eqdata[0]._replace(conditions_caches=None), np.array([-40000], np.float_))
+    assert np.all(np.isclose(errors, [-40000*0.5*0.5]))
 
 
 def test_driving_force_miscibility_gap(datasets_db):
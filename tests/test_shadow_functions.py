@@ -0,0 +1,63 @@
+"""
+Test espei.shadow_functions fast equilibrium functions.
+"""
+import dataclasses
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+from pycalphad import Database, variables as v
+from pycalphad.codegen.callables import build_phase_records
+from pycalphad.core.utils import instantiate_models, unpack_components
+
+from espei.shadow_functions import calculate_, equilibrium_, no_op_equilibrium_, \
+    constrained_equilibrium, build_conditions_cache
+
+from .testing_data import CU_MG_TDB
+
+
+def _setup_cu_mg(phases):
+    """Return the species, models and phase records for a Cu-Mg point calculation"""
+    dbf = Database(CU_MG_TDB)
+    species = sorted(unpack_components(dbf, ['CU', 'MG', 'VA']), key=str)
+    conds = {v.N: 1.0, v.P: 101325.0, v.T: 1000.0, v.X('MG'): 0.2}
+    models = instantiate_models(dbf, species, phases)
+    phase_records = build_phase_records(dbf, species, phases, conds, models, build_gradients=True, build_hessians=True)
+    str_statevar_dict = OrderedDict([(str(key), conds[key]) for key in sorted([v.N, v.P, v.T], key=str)])
+    return species, models, phase_records, conds, str_statevar_dict
+
+
+def test_equilibrium_same_with_conditions_dict_or_cache():
+    """equilibrium_ and no_op_equilibrium_ give the same result for a conditions dict and a ConditionsCache"""
+    phases = ['FCC_A1', 'HCP_A3', 'LIQUID']
+    species, models, phase_records, conds, str_statevar_dict = _setup_cu_mg(phases)
+    conds_cache = build_conditions_cache(conds)
+    for _equilibrium in (equilibrium_, no_op_equilibrium_):
+        grid = calculate_(species, phases, str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
+        eq_dict = _equilibrium(phase_records, conds, grid)
+        grid = calculate_(species, phases, str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
+        eq_cache = _equilibrium(phase_records, conds_cache, grid)
+        assert np.allclose(eq_dict.GM, eq_cache.GM, equal_nan=True)
+        assert np.allclose(eq_dict.MU, eq_cache.MU, equal_nan=True)
+        assert np.all(eq_dict.Phase == eq_cache.Phase)
+
+
+def test_constrained_equilibrium_same_with_conditions_dict_or_cache():
+    """constrained_equilibrium gives the same result for a conditions dict and a ConditionsCache"""
+    phases = ['FCC_A1']
+    species, models, phase_records, conds, str_statevar_dict = _setup_cu_mg(phases)
+    grid = calculate_(species, phases, str_statevar_dict, models, phase_records, pdens=50, fake_points=True)
+    converged_dict, energy_dict = constrained_equilibrium(phase_records, conds, grid)
+    converged_cache, energy_cache = constrained_equilibrium(phase_records, build_conditions_cache(conds), grid)
+    assert converged_dict and converged_cache
+    assert np.isclose(energy_dict, energy_cache)
+
+
+def test_conditions_cache_is_read_only():
+    """A ConditionsCache shared between evaluations cannot be modified in place"""
+    conds_cache = build_conditions_cache({v.N: 1.0, v.P: 101325.0, v.T: [300.0, 400.0], v.X('MG'): 0.2})
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        conds_cache.statevars = ()
+    for vals in list(conds_cache.conditions.values()) + list(conds_cache.str_conds.values()) + [conds_cache.point_state_vars]:
+        with pytest.raises(ValueError):
+            vals[0] = 0.0